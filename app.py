@@ -3,21 +3,37 @@ import pandas as pd
 import numpy as np
 import joblib
 import os
+import math
+import pickle
+import mmap
 import itertools
+from types import MappingProxyType
 import altair as alt
 
+# Model feature layout: 6 main effects followed by their 15 pairwise interactions
+CORE_FEATS = ('log_MLR', 'log_CRP', 'log_triglycerides', 'log_NLR', 'IJVC', 'sex')
+FEATURE_NAMES = CORE_FEATS + tuple(f"{a}*{b}" for a, b in itertools.combinations(CORE_FEATS, 2))
+# Upper-triangle indices enumerate pairs in the same order as itertools.combinations
+IU = np.triu_indices(len(CORE_FEATS), k=1)
+
+# Map raw names to readable names (unlisted features fall back to the raw name)
+READABLE_MAP = MappingProxyType({
+    'log_MLR': 'MLR (Inflammation)',
+    'log_CRP': 'CRP (Inflammation)',
+    'log_triglycerides': 'Triglycerides (Lipids)',
+    'log_NLR': 'NLR (Inflammation)',
+    'IJVC': 'Hx of IJV Cannulation',
+    'sex': 'Sex',
+    'log_MLR*log_CRP': 'Interaction: MLR x CRP',
+    'log_MLR*log_triglycerides': 'Interaction: MLR x TG',
+    'log_MLR*log_NLR': 'Interaction: MLR x NLR',
+})
+
 # ---------------------------------------------------------
-# 1. Page Configuration
+# Static Page Content
 # ---------------------------------------------------------
-st.set_page_config(
-    page_title="AVF Guardian | Smart Risk Assessment",
-    page_icon="�️",
-    layout="wide",
-    initial_sidebar_state="expanded"
-)
-
 # Custom CSS for Modern UI
-st.markdown("""
+CSS_BLOCK = """
 <style>
     /* Global Style */
     .stApp {
@@ -89,12 +105,57 @@ st.markdown("""
         text-align: center;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+# Intro Card
+WELCOME_CARD = """
+<div class="card">
+    <h4>👋 Welcome to the Clinical Decision Support System</h4>
+    <p>This tool utilizes the <strong>Extreme Minimalist Machine Learning Model</strong> (validated on 726 patients) 
+    to predict the risk of AVF dysfunction. It focuses on 6 key indicators, including novel inflammatory biomarkers 
+    (MLR, NLR) and lipid metabolism metrics.</p>
+</div>
+"""
+
+# Risk gauge: a ring filled clockwise in proportion to the probability.
+# Kept unindented so markdown doesn't treat it as a code block.
+GAUGE_RADIUS = 75
+GAUGE_CIRCUMFERENCE = 2 * math.pi * GAUGE_RADIUS
+GAUGE_SVG = """
+<div style="text-align:center">
+<svg width="200" height="200" viewBox="0 0 200 200" xmlns="http://www.w3.org/2000/svg">
+<circle cx="100" cy="100" r="{r}" fill="none" stroke="#ecf0f1" stroke-width="30"/>
+<circle cx="100" cy="100" r="{r}" fill="none" stroke="{color}" stroke-width="30" stroke-dasharray="{dash:.2f} {circ:.2f}" transform="rotate(-90 100 100)"/>
+<text x="100" y="100" text-anchor="middle" dominant-baseline="middle" font-size="20" font-weight="bold" fill="#2c3e50">{pct}</text>
+</svg>
+</div>
+"""
+
+# Footer disclaimer
+DISCLAIMER_MD = """
+<small>
+**Disclaimer:** This tool is for research and educational purposes only. 
+It is based on the "Extreme Minimalist Model" developed in a single-center retrospective study.
+Results should not replace professional clinical judgment.
+</small>
+"""
+
+# ---------------------------------------------------------
+# 1. Page Configuration
+# ---------------------------------------------------------
+st.set_page_config(
+    page_title="AVF Guardian | Smart Risk Assessment",
+    page_icon="�️",
+    layout="wide",
+    initial_sidebar_state="expanded"
+)
+
+st.markdown(CSS_BLOCK, unsafe_allow_html=True)
 
 # ---------------------------------------------------------
 # 2. Load Artifacts
 # ---------------------------------------------------------
-@st.cache_resource
+@st.cache_resource(ttl=None, show_spinner=False)
 def load_models():
     # Try different paths for robustness
     paths = [
@@ -113,20 +174,77 @@ def load_models():
         st.stop()
         
     try:
-        model = joblib.load(os.path.join(base_path, "lr_model.pkl"))
-        scaler = joblib.load(os.path.join(base_path, "scaler.pkl"))
-        winsor_limits = joblib.load(os.path.join(base_path, "winsor_limits.pkl"))
-        # Load stats if available, else use hardcoded defaults
-        try:
-            stats = joblib.load(os.path.join(base_path, "data_stats.pkl"))
-        except:
-            stats = {}
-        return model, scaler, winsor_limits, stats
+        bundle_path = os.path.join(base_path, "bundle.pkl")
+        if os.path.exists(bundle_path):
+            # Single plain-pickle artifact written by export_bundle.py, read straight from the page cache
+            with open(bundle_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                bundle = pickle.loads(mm)
+            model = bundle['model']
+            scaler = bundle['scaler']
+            winsor_limits = bundle['winsor_limits']
+            stats = bundle.get('stats', {})
+        else:
+            # Legacy layout: one pickle per artifact
+            model = joblib.load(os.path.join(base_path, "lr_model.pkl"))
+            scaler = joblib.load(os.path.join(base_path, "scaler.pkl"))
+            winsor_limits = joblib.load(os.path.join(base_path, "winsor_limits.pkl"))
+            # Load stats if available, else use hardcoded defaults
+            try:
+                stats = joblib.load(os.path.join(base_path, "data_stats.pkl"))
+            except:
+                stats = {}
+        # Normalize keys once and fold the limits into arrays in input order (MLR, CRP, TG, NLR).
+        # The hot path runs in float32, matching the artifacts saved by export_bundle.py.
+        winsor_norm = {k.strip().lower(): (v['lower'], v['upper']) for k, v in winsor_limits.items()}
+        numeric_cols = ('mlr', 'crp', 'triglycerides', 'nlr')
+        lows = np.array([winsor_norm[c][0] for c in numeric_cols], dtype=np.float32)
+        highs = np.array([winsor_norm[c][1] for c in numeric_cols], dtype=np.float32)
+        # Widget defaults: training-set medians when available, else hardcoded fallbacks
+        defaults = {
+            col: (float(stats[col]['50%']) if col in stats and '50%' in stats[col] else fallback)
+            for col, fallback in (('MLR', 0.4), ('CRP', 5.0), ('NLR', 3.0), ('triglycerides', 1.5))
+        }
+        # Logistic-regression weights (forward pass and contribution chart) and display names
+        coef = model.coef_[0].astype(np.float32)
+        intercept = float(model.intercept_[0])
+        feature_names = model.feature_names_in_ if hasattr(model, 'feature_names_in_') else FEATURE_NAMES
+        readable_names = np.array([READABLE_MAP.get(n, n) for n in feature_names])
+        # StandardScaler as a raw affine transform (reciprocal turns the divide into a multiply)
+        mean_ = scaler.mean_.astype(np.float32)
+        inv_scale_ = (1.0 / scaler.scale_).astype(np.float32)
+        # Cached resources are shared across sessions: freeze the arrays so nothing mutates them in place
+        for arr in (lows, highs, coef, readable_names, mean_, inv_scale_):
+            arr.setflags(write=False)
+        return lows, highs, defaults, coef, intercept, readable_names, mean_, inv_scale_
     except Exception as e:
         st.error(f"Error loading model files: {e}")
         st.stop()
 
-model, scaler, winsor_limits, stats = load_models()
+# Called at the top of every run so artifacts are loaded before any widget is drawn
+lows, highs, defaults, coef, intercept, readable_names, mean_, inv_scale_ = load_models()
+
+# Batch prediction path: every function works on N patients at once. The form
+# uses 1-row batches; a CSV upload can feed the same functions in chunks.
+def build_features(core_batch, ijvc_col, sex_col):
+    """(N, 4) raw MLR/CRP/TG/NLR plus (N,) IJVC and sex -> (N, 21) features in FEATURE_NAMES order."""
+    # Winsorize & Log (Mirror training logic)
+    core = np.log1p(np.clip(np.asarray(core_batch, dtype=np.float32), lows, highs))
+    x6 = np.column_stack([core, np.asarray(ijvc_col, dtype=np.float32), np.asarray(sex_col, dtype=np.float32)])
+    # Main effects followed by the upper triangle of each row's outer product
+    inter = np.einsum('bi,bj->bij', x6, x6)[:, IU[0], IU[1]]
+    return np.concatenate([x6, inter], axis=1)
+
+def scale_features(x_full):
+    """StandardScaler transform as a raw affine map."""
+    return (x_full - mean_) * inv_scale_
+
+def predict_scaled(x_scaled):
+    """Sigmoid of the linear score, same as predict_proba[:, 1]."""
+    return 1.0 / (1.0 + np.exp(-(x_scaled @ coef + intercept)))
+
+def predict(core_batch, ijvc_col, sex_col):
+    """(N, 4) biomarkers plus (N,) IJVC and sex -> (N,) risk probabilities."""
+    return predict_scaled(scale_features(build_features(core_batch, ijvc_col, sex_col)))
 
 # ---------------------------------------------------------
 # 3. Sidebar Inputs
@@ -134,11 +252,6 @@ model, scaler, winsor_limits, stats = load_models()
 st.sidebar.title("Patient Parameters")
 st.sidebar.markdown("Enter the 6 core variables:")
 
-def get_default(col, fallback):
-    if col in stats and '50%' in stats[col]:
-        return float(stats[col]['50%'])
-    return fallback
-
 with st.sidebar.form("prediction_form"):
     # Group 1: Demographics & History
     st.markdown("### 1. Clinical History")
@@ -150,12 +263,12 @@ with st.sidebar.form("prediction_form"):
     
     col1, col2 = st.columns(2)
     with col1:
-        mlr = st.number_input("MLR", min_value=0.0, max_value=10.0, value=get_default('MLR', 0.4), step=0.01, help="Monocyte-to-Lymphocyte Ratio")
-        crp = st.number_input("CRP (mg/L)", min_value=0.0, max_value=200.0, value=get_default('CRP', 5.0), step=0.1)
+        mlr = st.number_input("MLR", min_value=0.0, max_value=10.0, value=defaults['MLR'], step=0.01, help="Monocyte-to-Lymphocyte Ratio")
+        crp = st.number_input("CRP (mg/L)", min_value=0.0, max_value=200.0, value=defaults['CRP'], step=0.1)
     
     with col2:
-        nlr = st.number_input("NLR", min_value=0.0, max_value=50.0, value=get_default('NLR', 3.0), step=0.1, help="Neutrophil-to-Lymphocyte Ratio")
-        tg = st.number_input("Triglycerides (mmol/L)", min_value=0.0, max_value=20.0, value=get_default('triglycerides', 1.5), step=0.1)
+        nlr = st.number_input("NLR", min_value=0.0, max_value=50.0, value=defaults['NLR'], step=0.1, help="Neutrophil-to-Lymphocyte Ratio")
+        tg = st.number_input("Triglycerides (mmol/L)", min_value=0.0, max_value=20.0, value=defaults['triglycerides'], step=0.1)
 
     submitted = st.form_submit_button("Predict Risk 🚀")
 
@@ -167,60 +280,48 @@ st.markdown('<h1 class="main-title">AVF Guardian</h1>', unsafe_allow_html=True)
 st.markdown('<p class="sub-title">Smart Risk Assessment for Arteriovenous Fistula Dysfunction</p>', unsafe_allow_html=True)
 
 # Intro Card
-st.markdown("""
-<div class="card">
-    <h4>👋 Welcome to the Clinical Decision Support System</h4>
-    <p>This tool utilizes the <strong>Extreme Minimalist Machine Learning Model</strong> (validated on 726 patients) 
-    to predict the risk of AVF dysfunction. It focuses on 6 key indicators, including novel inflammatory biomarkers 
-    (MLR, NLR) and lipid metabolism metrics.</p>
-</div>
-""", unsafe_allow_html=True)
+st.markdown(WELCOME_CARD, unsafe_allow_html=True)
 
+# Hand the submitted values to the results fragment; the form itself already
+# batches widget edits so nothing reruns until "Predict Risk" is pressed
 if submitted:
-    # 4.1 Preprocessing
-    input_data = {
-        'MLR': mlr, 'CRP': crp, 'triglycerides': tg, 'NLR': nlr,
-        'IJVC': ijvc, 'sex': sex
-    }
-    df_input = pd.DataFrame([input_data])
-    
-    # Winsorize & Log (Mirror training logic)
-    numeric_cols = ['MLR', 'CRP', 'triglycerides', 'NLR']
-    for col in numeric_cols:
-        # Find limits (handle case sensitivity if needed)
-        limits = None
-        for k in winsor_limits:
-            if k.strip().lower() == col.strip().lower():
-                limits = winsor_limits[k]
-                break
-        
-        val = df_input[col].values[0]
-        if limits:
-            val = max(limits['lower'], min(val, limits['upper']))
-        
-        # Log transform
-        df_input[f'log_{col}'] = np.log1p(val)
-        
-    # Generate Features (Interactions)
-    core_feats = ['log_MLR', 'log_CRP', 'log_triglycerides', 'log_NLR', 'IJVC', 'sex']
-    
-    # Ensure columns exist (IJVC and sex are already there)
+    st.session_state['patient'] = (mlr, crp, tg, nlr, ijvc, sex)
+
+@st.fragment
+def results():
+    patient = st.session_state.get('patient')
+    if patient is None:
+        # Placeholder when no prediction made
+        st.info("👈 Please enter patient data in the sidebar and click 'Predict Risk' to start assessment.")
     
-    X_final = pd.DataFrame(index=[0])
-    # Add Main Effects
-    for f in core_feats:
-        X_final[f] = df_input[f]
-        
-    # Add Interactions
-    for c1, c2 in itertools.combinations(core_feats, 2):
-        X_final[f"{c1}*{c2}"] = df_input[c1] * df_input[c2]
+        # Add some visual fluff
+        col_demo1, col_demo2 = st.columns(2)
+        with col_demo1:
+            st.markdown("""
+            ### Key Features
+            *   **Extreme Minimalism**: Uses only 6 variables.
+            *   **High Utility**: Validated by NRI & DCA.
+            *   **Inflammation-Centric**: Incorporates MLR & NLR.
+            """)
+        with col_demo2:
+            st.markdown("""
+            ### Target Population
+            *   Maintenance Hemodialysis Patients
+            *   Autogenous AVF
+            *   Dialysis Vintage ≥ 3 months
+            """)
+        return
+
+    # 4.1 Preprocessing (1-row batch)
+    mlr, crp, tg, nlr, ijvc, sex = patient
+    x_full = build_features([[mlr, crp, tg, nlr]], [ijvc], [sex])
         
     # Scale
     try:
-        X_scaled = scaler.transform(X_final)
+        x_scaled = scale_features(x_full)
         
         # Predict
-        prob = model.predict_proba(X_scaled)[0, 1]
+        prob = float(predict_scaled(x_scaled)[0])
         
         # 4.2 Display Results
         st.divider()
@@ -241,20 +342,15 @@ if submitted:
                 st.markdown('<div style="margin-top:20px"><span class="risk-badge risk-high">HIGH RISK</span></div>', unsafe_allow_html=True)
 
         with col_res3:
-             # Gauge Chart using Altair
+             # Gauge Chart (static SVG)
             st.write("**Risk Scale**")
             
-            gauge_chart = alt.Chart(pd.DataFrame({'value': [prob]})).mark_arc(innerRadius=50).encode(
-                theta=alt.Theta("value", scale=alt.Scale(domain=[0, 1])),
-                color=alt.Color("value", scale=alt.Scale(domain=[0, 0.5, 1], range=['green', 'yellow', 'red']), legend=None),
-                tooltip=['value']
-            ).properties(width=200, height=200)
-            
-            text = alt.Chart(pd.DataFrame({'value': [f"{prob:.1%}"]})).mark_text(align='center', baseline='middle', fontSize=20, fontWeight='bold').encode(
-                text='value'
-            )
-            
-            st.altair_chart(gauge_chart + text, use_container_width=True)
+            # Color follows the risk badge bins
+            gauge_color = '#2ecc71' if prob < 0.2 else '#f1c40f' if prob < 0.5 else '#e74c3c'
+            st.markdown(GAUGE_SVG.format(
+                r=GAUGE_RADIUS, color=gauge_color, dash=prob * GAUGE_CIRCUMFERENCE,
+                circ=GAUGE_CIRCUMFERENCE, pct=f"{prob:.1%}"
+            ), unsafe_allow_html=True)
             
             # Suggestion Box
             st.markdown("### 📋 Clinical Interpretation & Recommendations")
@@ -297,37 +393,18 @@ if submitted:
         st.markdown('<div class="card"><h4>🔍 Individualized Risk Factor Analysis</h4>', unsafe_allow_html=True)
         st.caption("Which factors contributed most to this specific prediction?")
         
-        coeffs = model.coef_[0]
-        feature_names = model.feature_names_in_ if hasattr(model, 'feature_names_in_') else X_final.columns
-        
-        # Map raw names to readable names
-        readable_map = {
-            'log_MLR': 'MLR (Inflammation)',
-            'log_CRP': 'CRP (Inflammation)',
-            'log_triglycerides': 'Triglycerides (Lipids)',
-            'log_NLR': 'NLR (Inflammation)',
-            'IJVC': 'Hx of IJV Cannulation',
-            'sex': 'Sex',
-            'log_MLR*log_CRP': 'Interaction: MLR x CRP',
-            'log_MLR*log_triglycerides': 'Interaction: MLR x TG',
-            'log_MLR*log_NLR': 'Interaction: MLR x NLR',
-            # Add other potential interactions if they exist, or generic fallback
-        }
-        
-        contributions = []
-        for name, coef, val in zip(feature_names, coeffs, X_scaled[0]):
-            readable_name = readable_map.get(name, name)
-            # Calculate contribution (coef * value)
-            contrib_val = coef * val
-            contributions.append({'Risk Factor': readable_name, 'Impact': contrib_val})
-            
-        df_contrib = pd.DataFrame(contributions).sort_values(by='Impact', ascending=False, key=abs)
+        contrib = coef * x_scaled[0]
+        # Top-6 by absolute impact: partial selection, then order just those six
+        impact = np.abs(contrib)
+        order = np.argpartition(-impact, 6)[:6]
+        order = order[np.argsort(-impact[order])]
+        df_contrib = pd.DataFrame({'Risk Factor': readable_names[order], 'Impact': contrib[order]})
         
         # Color coding for chart
-        df_contrib['Type'] = df_contrib['Impact'].apply(lambda x: 'Increases Risk' if x > 0 else 'Decreases Risk')
+        df_contrib['Type'] = np.where(df_contrib['Impact'] > 0, 'Increases Risk', 'Decreases Risk')
         
         # Altair Bar Chart
-        c = alt.Chart(df_contrib.head(6)).mark_bar().encode(
+        c = alt.Chart(df_contrib).mark_bar().encode(
             x=alt.X('Impact', title='Contribution to Risk Score'),
             y=alt.Y('Risk Factor', sort='-x', title=None),
             color=alt.Color('Type', scale=alt.Scale(domain=['Increases Risk', 'Decreases Risk'], range=['#e74c3c', '#2ecc71'])),
@@ -342,53 +419,49 @@ if submitted:
         
     except Exception as e:
         st.error(f"Prediction Error: {e}")
-        st.write("Debug Info:", X_final)
+        st.write("Debug Info:", pd.DataFrame(x_full, columns=list(FEATURE_NAMES)))
 
-else:
-    # Placeholder when no prediction made
-    st.info("👈 Please enter patient data in the sidebar and click 'Predict Risk' to start assessment.")
-    
-    # Add some visual fluff
-    col_demo1, col_demo2 = st.columns(2)
-    with col_demo1:
-        st.markdown("""
-        ### Key Features
-        *   **Extreme Minimalism**: Uses only 6 variables.
-        *   **High Utility**: Validated by NRI & DCA.
-        *   **Inflammation-Centric**: Incorporates MLR & NLR.
-        """)
-    with col_demo2:
-        st.markdown("""
-        ### Target Population
-        *   Maintenance Hemodialysis Patients
-        *   Autogenous AVF
-        *   Dialysis Vintage ≥ 3 months
-        """)
+results()
 
 # ---------------------------------------------------------
 # 5. Variable Definitions
 # ---------------------------------------------------------
+@st.cache_data
+def _var_df():
+    return pd.DataFrame({
+        'Variable (变量名)': ['IJVC', 'MLR', 'NLR', 'CRP', 'Triglycerides', 'Sex'],
+        'Full Name (全称)': [
+            'Ipsilateral Internal Jugular Vein Cannulation',
+            'Monocyte-to-Lymphocyte Ratio',
+            'Neutrophil-to-Lymphocyte Ratio',
+            'C-Reactive Protein',
+            'Triglycerides',
+            'Gender',
+        ],
+        'Description': [
+            'History of central venous catheterization on the same side as the AVF. A key risk factor for central venous stenosis.',
+            'Ratio of monocyte count to lymphocyte count. Reflects the balance between innate and adaptive immunity; high values are associated with vascular inflammation.',
+            'Ratio of neutrophil count to lymphocyte count. A classic marker of systemic inflammation and stress response.',
+            'An acute-phase protein synthesized by the liver, serving as a sensitive marker of systemic inflammation.',
+            'A type of lipid in the blood. Abnormal lipid metabolism may impair vascular endothelial function.',
+            'Biological sex. Differences in vessel diameter and hormonal profiles may influence AVF patency.',
+        ],
+        '说明': [
+            '动静脉内瘘同侧颈内静脉置管史。指患者在建立内瘘的一侧，既往是否进行过颈内静脉置管（透析导管）。这是导致中心静脉狭窄的重要危险因素。',
+            '单核细胞与淋巴细胞比值。反映全身炎症反应与免疫状态的平衡，高值通常与血管内膜增生和炎症相关。',
+            '中性粒细胞与淋巴细胞比值。经典的系统性炎症指标，反映机体炎症及应激状态。',
+            'C-反应蛋白。肝脏合成的急性时相反应蛋白，反映体内系统性炎症水平的敏感指标。',
+            '甘油三酯。血液中的一种脂质。脂代谢异常可能损害血管内皮功能并促进动脉粥样硬化。',
+            '性别。解剖结构（如血管直径）和激素水平的差异可能影响内瘘通畅率及成熟结局。',
+        ],
+    })
+
 st.divider()
 with st.expander("ℹ️ Variable Definitions & Clinical Explanations (变量说明)", expanded=False):
-    st.markdown("""
-    | Variable (变量名) | Full Name (全称) | Description (Description / 说明) |
-    | :--- | :--- | :--- |
-    | **IJVC** | **Ipsilateral Internal Jugular Vein Cannulation** | **English**: History of central venous catheterization on the same side as the AVF. A key risk factor for central venous stenosis.<br>**Chinese**: **动静脉内瘘同侧颈内静脉置管史**。指患者在建立内瘘的一侧，既往是否进行过颈内静脉置管（透析导管）。这是导致中心静脉狭窄的重要危险因素。 |
-    | **MLR** | **Monocyte-to-Lymphocyte Ratio** | **English**: Ratio of monocyte count to lymphocyte count. Reflects the balance between innate and adaptive immunity; high values are associated with vascular inflammation.<br>**Chinese**: **单核细胞与淋巴细胞比值**。反映全身炎症反应与免疫状态的平衡，高值通常与血管内膜增生和炎症相关。 |
-    | **NLR** | **Neutrophil-to-Lymphocyte Ratio** | **English**: Ratio of neutrophil count to lymphocyte count. A classic marker of systemic inflammation and stress response.<br>**Chinese**: **中性粒细胞与淋巴细胞比值**。经典的系统性炎症指标，反映机体炎症及应激状态。 |
-    | **CRP** | **C-Reactive Protein** | **English**: An acute-phase protein synthesized by the liver, serving as a sensitive marker of systemic inflammation.<br>**Chinese**: **C-反应蛋白**。肝脏合成的急性时相反应蛋白，反映体内系统性炎症水平的敏感指标。 |
-    | **Triglycerides** | **Triglycerides** | **English**: A type of lipid in the blood. Abnormal lipid metabolism may impair vascular endothelial function.<br>**Chinese**: **甘油三酯**。血液中的一种脂质。脂代谢异常可能损害血管内皮功能并促进动脉粥样硬化。 |
-    | **Sex** | **Gender** | **English**: Biological sex. Differences in vessel diameter and hormonal profiles may influence AVF patency.<br>**Chinese**: **性别**。解剖结构（如血管直径）和激素水平的差异可能影响内瘘通畅率及成熟结局。 |
-    """)
+    st.dataframe(_var_df(), use_container_width=True, hide_index=True)
 
 # ---------------------------------------------------------
 # 6. Footer / Disclaimer
 # ---------------------------------------------------------
 st.divider()
-st.markdown("""
-<small>
-**Disclaimer:** This tool is for research and educational purposes only. 
-It is based on the "Extreme Minimalist Model" developed in a single-center retrospective study.
-Results should not replace professional clinical judgment.
-</small>
-""", unsafe_allow_html=True)
+st.markdown(DISCLAIMER_MD, unsafe_allow_html=True)
@@ -0,0 +1,40 @@
+import joblib
+import numpy as np
+import os
+import pickle
+import sys
+
+# ---------------------------------------------------------
+# Pack the trained artifacts into a single bundle for app.py
+# ---------------------------------------------------------
+# Usage: python export_bundle.py [Models directory]
+# Reads the per-artifact pickles saved at training time and writes
+# bundle.pkl next to them, so the app loads everything in one call.
+# The bundle is a plain pickle (no joblib framing) so app.py can read it
+# with pickle + mmap.
+
+def main(base_path="Models"):
+    model = joblib.load(os.path.join(base_path, "lr_model.pkl"))
+    scaler = joblib.load(os.path.join(base_path, "scaler.pkl"))
+
+    # float32 is plenty for a 21-coefficient logistic regression and halves the array payload
+    model.coef_ = model.coef_.astype(np.float32)
+    model.intercept_ = model.intercept_.astype(np.float32)
+    scaler.mean_ = scaler.mean_.astype(np.float32)
+    scaler.scale_ = scaler.scale_.astype(np.float32)
+
+    bundle = {
+        'model': model,
+        'scaler': scaler,
+        'winsor_limits': joblib.load(os.path.join(base_path, "winsor_limits.pkl")),
+    }
+    stats_path = os.path.join(base_path, "data_stats.pkl")
+    bundle['stats'] = joblib.load(stats_path) if os.path.exists(stats_path) else {}
+
+    out_path = os.path.join(base_path, "bundle.pkl")
+    with open(out_path, "wb") as f:
+        pickle.dump(bundle, f, protocol=pickle.HIGHEST_PROTOCOL)
+    print(f"Saved {out_path}")
+
+if __name__ == "__main__":
+    main(*sys.argv[1:])